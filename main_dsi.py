@@ -9,6 +9,7 @@ Auto-detects actual screen resolution at runtime.
 """
 
 import argparse
+import logging
 import os
 import signal
 import sys
@@ -892,6 +893,14 @@ Hardware Integration:
     )
     args = parser.parse_args()
 
+    # WebSocket client per-event logging (keeps the [WebSocket] console prefix)
+    ws_log_handler = logging.StreamHandler(sys.stdout)
+    ws_log_handler.setFormatter(logging.Formatter("[WebSocket] %(message)s"))
+    ws_log = logging.getLogger("openclaw.ws")
+    ws_log.addHandler(ws_log_handler)
+    ws_log.setLevel(logging.INFO)
+    ws_log.propagate = False  # printed here only, even if root logging is configured
+
     # Override fullscreen setting
     if args.windowed:
         config.DSI_DISPLAY["fullscreen"] = False
@@ -6,8 +6,9 @@ Supports both demo mode (simulated data) and live WebSocket connection.
 import random
 import threading
 import time
-from datetime import datetime, timedelta
-from typing import Callable, Dict, List, Optional, Any
+from collections import deque
+from datetime import datetime
+from typing import Callable, Deque, Dict, List, Mapping, Optional, Any
 
 from websocket_client import (
     OpenClawWebSocketClient,
@@ -75,8 +76,8 @@ class OpenClawBridge:
         self._message_index = 0
         self._ws_messages_cursor = 0  # Track how many ws messages have been returned
         self._current_streaming: Optional[StreamingMessage] = None
-        self._notifications: List[Notification] = []
         self._max_notifications = 10
+        self._notifications: Deque[Notification] = deque(maxlen=self._max_notifications)
 
         self._status = {
             "connected": False,
@@ -151,9 +152,9 @@ class OpenClawBridge:
 
     def _handle_ws_message_chunk(self, msg_id: str, chunk: str):
         """Handle streaming message chunk from WebSocket."""
-        with self.lock:
-            self._status["is_streaming"] = True
-            self._status["last_activity"] = datetime.now()
+        # Single-key writes are atomic; no lock needed on the per-chunk path
+        self._status["is_streaming"] = True
+        self._status["last_activity"] = datetime.now()
 
         if self._on_message_chunk:
             self._on_message_chunk(msg_id, chunk)
@@ -162,8 +163,8 @@ class OpenClawBridge:
         """Handle completed message from WebSocket."""
         with self.lock:
             self._messages.append(message)
-            self._status["is_streaming"] = False
-            self._status["last_activity"] = datetime.now()
+        self._status["is_streaming"] = False
+        self._status["last_activity"] = datetime.now()
 
         if self._on_message_complete:
             self._on_message_complete(message)
@@ -172,8 +173,6 @@ class OpenClawBridge:
         """Handle notification from WebSocket."""
         with self.lock:
             self._notifications.append(notification)
-            if len(self._notifications) > self._max_notifications:
-                self._notifications = self._notifications[-self._max_notifications:]
 
         if self._on_notification:
             self._on_notification(notification)
@@ -345,7 +344,7 @@ class OpenClawBridge:
 
     def get_notifications(self, max_age_seconds: float = 10.0) -> List[Notification]:
         """Get recent notifications."""
-        cutoff = datetime.now() - timedelta(seconds=max_age_seconds)
+        cutoff = time.time() - max_age_seconds
         with self.lock:
             return [n for n in self._notifications if n.timestamp > cutoff]
 
@@ -359,8 +358,6 @@ class OpenClawBridge:
         )
         with self.lock:
             self._notifications.append(notification)
-            if len(self._notifications) > self._max_notifications:
-                self._notifications = self._notifications[-self._max_notifications:]
 
         if self._on_notification:
             self._on_notification(notification)
@@ -520,17 +517,20 @@ class OpenClawBridge:
         if self._on_approval_requested:
             self._on_approval_requested(approval)
 
-    def get_presence_data(self) -> Dict:
+    def get_presence_data(self) -> Mapping[str, Any]:
+        """Presence entries keyed by device ID (read-only snapshot)."""
         if self._ws_client:
             return self._ws_client.presence_data
         return {}
 
-    def get_health_data(self) -> Dict:
+    def get_health_data(self) -> Mapping[str, Any]:
+        """Latest gateway health payload (read-only snapshot)."""
         if self._ws_client:
             return self._ws_client.health_data
         return {}
 
-    def get_gateway_info(self) -> Dict:
+    def get_gateway_info(self) -> Mapping[str, Any]:
+        """Gateway info from the connect handshake (read-only snapshot)."""
         if self._ws_client:
             return self._ws_client.gateway_info
         return {}
@@ -540,15 +540,15 @@ class OpenClawBridge:
             return self._ws_client.pending_approvals
         return []
 
-    def get_runs_data(self) -> list:
+    def get_runs_data(self) -> tuple:
         if self._ws_client:
             return self._ws_client.runs_data
-        return []
+        return ()
 
-    def get_cron_data(self) -> list:
+    def get_cron_data(self) -> tuple:
         if self._ws_client:
             return self._ws_client.cron_data
-        return []
+        return ()
 
     def get_last_tick(self) -> float:
         if self._ws_client:
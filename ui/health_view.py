@@ -4,6 +4,8 @@ Shows gateway status, heartbeat, and connected devices.
 """
 
 import time
+from collections.abc import Mapping
+
 from PIL import ImageDraw
 
 import config_dsi as config
@@ -69,7 +71,7 @@ class HealthView(RightPanelView):
 
         # Last heartbeat
         if last_tick > 0:
-            ago = time.time() - last_tick
+            ago = time.monotonic() - last_tick
             if ago < 60:
                 tick_str = f"Heartbeat: {int(ago)}s ago"
             else:
@@ -92,7 +94,7 @@ class HealthView(RightPanelView):
         max_y = y + height - 10
 
         if presence_data:
-            devices = list(presence_data.values()) if isinstance(presence_data, dict) else []
+            devices = list(presence_data.values()) if isinstance(presence_data, Mapping) else []
             for dev in devices:
                 if cy + device_card_h > max_y:
                     break
@@ -13,16 +13,21 @@ Protocol:
 import asyncio
 import base64
 import hashlib
+import inspect
+import itertools
 import json
+import logging
 import os
 import threading
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Callable, Optional, Dict, Any, List, Deque, FrozenSet, Mapping, Tuple
 
 # Try to import cryptography for device signing
 try:
@@ -34,6 +39,39 @@ except ImportError:
     print("[WebSocket] WARNING: cryptography library not installed")
     print("[WebSocket] Install with: pip install cryptography")
 
+# Dump raw handshake frames (OPENCLAW_WS_DEBUG=1); off by default since it
+# serializes whole payloads just to print a prefix
+DEBUG = os.environ.get("OPENCLAW_WS_DEBUG") == "1"
+
+# Use orjson for frame parsing/serialization when available (stdlib fallback)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj, default=None) -> str:
+        """Serialize to a JSON str (sent as a text frame)."""
+        return orjson.dumps(obj, default=default).decode()
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+
+def _first_key(d: Dict, keys: Tuple[str, ...], default=None):
+    """Return the value of the first of keys that is set (not None) in d."""
+    for key in keys:
+        value = d.get(key)
+        if value is not None:
+            return value
+    return default
+
+
+# Pre-serialized request frames; only the request ID and session key vary
+_SESSIONS_LIST_FRAME = '{"type":"req","id":"%s","method":"sessions.list","params":{}}'
+_CHAT_HISTORY_FRAME = '{"type":"req","id":"%s","method":"chat.history","params":{"sessionKey":%s,"limit":%d}}'
+_APPROVAL_RESPOND_FRAME = '{"type":"req","id":"%s","method":"exec.approval.respond","params":{"id":%s,"approved":%s}}'
+
 
 class ConnectionState(Enum):
     """WebSocket connection states."""
@@ -71,13 +109,22 @@ class StreamingMessage:
     """Represents a message being streamed."""
     id: str
     role: str
-    content: str = ""
     complete: bool = False
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)  # epoch seconds
+    _content: str = field(default="", repr=False)
+
+    @property
+    def content(self) -> str:
+        """Message text received so far."""
+        return self._content
 
     def append_chunk(self, chunk: str):
-        """Append a chunk to the message content."""
-        self.content += chunk
+        """Append a chunk to the message content (owner thread only).
+
+        The client calls this once per chunk flush window with the joined
+        deltas, not once per token, so the string is rebuilt rarely.
+        """
+        self._content += chunk
 
 
 @dataclass
@@ -86,7 +133,7 @@ class Notification:
     type: str  # info, success, warning, error
     title: str
     message: str = ""
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)  # epoch seconds
     duration: float = 2.0  # seconds to display
 
 
@@ -97,6 +144,25 @@ class OpenClawWebSocketClient:
     Runs in a background thread with an asyncio event loop.
     """
 
+    # Client identity sent in the connect request and signed in the auth payload
+    CLIENT_ID = "cli"
+    CLIENT_MODE = "cli"
+    ROLE = "operator"
+    SCOPES = ["operator.read", "operator.write", "operator.admin"]
+
+    # Number of recent messages loaded from chat.history on connect
+    HISTORY_LIMIT = 10
+
+    # Streamed deltas are handed to on_message_chunk at most this often (~60Hz)
+    CHUNK_FLUSH_INTERVAL = 0.016
+
+    # Status changes within this window reach on_status_change as one call
+    STATUS_FLUSH_INTERVAL = 0.016
+
+    # Received frames waiting to be handled; when full the reader stops
+    # reading, so websockets' own max_queue flow control applies again
+    INBOX_MAX_FRAMES = 64
+
     def __init__(
         self,
         url: str = "ws://localhost:18789",
@@ -124,12 +190,18 @@ class OpenClawWebSocketClient:
         self._lock = threading.Lock()
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._thread: Optional[threading.Thread] = None
+        # Per-event logging goes through a logger so formatting is skipped
+        # when the level is disabled: info() calls are always behind an
+        # isEnabledFor guard, warnings/errors only when their arguments are
+        # costly to build. One-off setup/connect paths still print.
+        self._log = logging.getLogger("openclaw.ws")
         self._websocket = None
+        self._send_queue: Optional[asyncio.Queue] = None
         self._running = False
 
         # Request tracking
         self._request_id = 0
-        self._pending_requests: Dict[str, asyncio.Future] = {}
+        self._pending_requests: Dict[int, asyncio.Future] = {}
 
         # Reconnection settings
         self._reconnect_delay = 1.0
@@ -139,44 +211,99 @@ class OpenClawWebSocketClient:
         # Current streaming message
         self._current_streaming: Optional[StreamingMessage] = None
 
+        # Deltas waiting to be delivered to on_message_chunk
+        self._chunk_buffer: List[str] = []
+        self._chunk_run_id: Optional[str] = None
+        self._chunk_flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # Pending on_status_change notification (see _mark_status_dirty)
+        self._status_flush_handle: Optional[asyncio.TimerHandle] = None
+
         # Message history (thread-safe access)
-        self._messages: List[Dict] = []
         self._max_messages = 100
+        self._messages: Deque[Dict] = deque(maxlen=self._max_messages)
 
         # Status data
-        self._status: Dict[str, Any] = {
+        self._status: Mapping[str, Any] = MappingProxyType({
             "model": "unknown",
             "tokens_in": 0,
             "tokens_out": 0,
             "cost": 0.0,
             "current_task": "Idle",
             "is_streaming": False,
-        }
+        })
+
+        # chat.send idempotency keys: one random prefix plus a counter
+        self._idem_prefix = uuid.uuid4().hex
+        self._idem_counter = itertools.count()
 
         # Session tracking
         self._session_id: Optional[str] = None
         self._session_key: Optional[str] = None
-        self._subscribed_sessions: set = set()
+        # Replaced (never mutated) on update so readers need no lock
+        self._subscribed_sessions: FrozenSet[str] = frozenset()
 
         # Device keys for authentication
         self._private_key = None
         self._public_key = None
         self._device_id = None
+        self._public_key_b64 = ""
         self._load_or_generate_keys()
 
+        # Auth payload fields that only change with the device keys
+        self._auth_prefix = "|".join([
+            "v2",  # version (v2 when nonce exists)
+            self._device_id,
+            self.CLIENT_ID,
+            self.CLIENT_MODE,
+            self.ROLE,
+            ",".join(self.SCOPES),
+        ]) + "|"
+
         # Deep integration state
-        self._presence_data: Dict[str, Any] = {}
-        self._health_data: Dict[str, Any] = {}
-        self._gateway_info: Dict[str, Any] = {}
-        self._pending_approvals: List[Dict] = []
-        self._last_tick: float = 0
-        self._runs_data: List[Dict] = []
-        self._cron_data: List[Dict] = []
-
-    def _next_request_id(self) -> str:
-        """Generate next request ID."""
+        # Presence/health/gateway snapshots are read-only mappings replaced
+        # wholesale on update, so the accessors return them without copying
+        self._presence_data: Mapping[str, Any] = MappingProxyType({})
+        self._health_data: Mapping[str, Any] = MappingProxyType({})
+        self._gateway_info: Mapping[str, Any] = MappingProxyType({})
+        self._pending_approvals: Dict[str, Dict] = {}  # by approval ID, in arrival order
+        self._last_tick: float = 0  # time.monotonic() of the last heartbeat
+        # Immutable snapshots, replaced wholesale so reads need no lock
+        self._runs_data: Tuple[Dict, ...] = ()
+        self._cron_data: Tuple[Dict, ...] = ()
+
+        # Dispatch tables (one dict lookup per incoming message/event)
+        self._message_handlers: Dict[str, Callable[[Dict], None]] = {
+            "res": self._handle_response,
+            "event": self._handle_event_message,
+            "req": self._handle_server_request,
+        }
+        self._event_handlers: Dict[str, Callable[[Dict], None]] = {
+            "agent": self._handle_agent_event,
+            "chat": self._handle_chat_event,
+            "health": self._handle_health_event,
+            "error": self._handle_error_event,
+            "cancelled": self._handle_cancelled_event,
+            "cancel": self._handle_cancelled_event,
+            "shutdown": self._handle_shutdown_event,
+            "presence": self._handle_presence_event,
+            "exec.approval.requested": self._handle_approval_requested_event,
+        }
+        self._agent_stream_handlers: Dict[str, Callable[[str, Dict], None]] = {
+            "lifecycle": self._handle_lifecycle_stream,
+            "assistant": self._handle_assistant_stream,
+            "tool": self._handle_tool_stream,
+        }
+        self._lifecycle_phase_handlers: Dict[str, Callable[[str, Dict], None]] = {
+            "start": self._handle_run_start,
+            "end": self._handle_run_end,
+            "error": self._handle_run_error,
+        }
+
+    def _next_request_id(self) -> int:
+        """Generate next request ID (sent on the wire as a string)."""
         self._request_id += 1
-        return str(self._request_id)
+        return self._request_id
 
     def _get_keys_path(self) -> Path:
         """Get path for storing device keys."""
@@ -200,12 +327,7 @@ class OpenClawWebSocketClient:
                 private_bytes = base64.b64decode(data["private_key"])
                 self._private_key = ed25519.Ed25519PrivateKey.from_private_bytes(private_bytes)
                 self._public_key = self._private_key.public_key()
-                # Device ID must be derived from public key fingerprint (full SHA-256)
-                public_bytes = self._public_key.public_bytes(
-                    encoding=serialization.Encoding.Raw,
-                    format=serialization.PublicFormat.Raw
-                )
-                self._device_id = hashlib.sha256(public_bytes).hexdigest()
+                self._device_id, self._public_key_b64 = self._derive_device_id(self._public_key)
                 print(f"[WebSocket] Loaded device keys (ID: {self._device_id[:8]}...)")
                 return
             except Exception as e:
@@ -215,12 +337,7 @@ class OpenClawWebSocketClient:
         print("[WebSocket] Generating new device keys...")
         self._private_key = ed25519.Ed25519PrivateKey.generate()
         self._public_key = self._private_key.public_key()
-        # Device ID must be derived from public key fingerprint (full SHA-256)
-        public_bytes = self._public_key.public_bytes(
-            encoding=serialization.Encoding.Raw,
-            format=serialization.PublicFormat.Raw
-        )
-        self._device_id = hashlib.sha256(public_bytes).hexdigest()
+        self._device_id, self._public_key_b64 = self._derive_device_id(self._public_key)
 
         # Save keys
         try:
@@ -240,46 +357,38 @@ class OpenClawWebSocketClient:
         except Exception as e:
             print(f"[WebSocket] Failed to save keys: {e}")
 
-    def _get_public_key_base64(self) -> str:
-        """Get public key as base64 string."""
-        if not self._public_key:
-            return ""
-        public_bytes = self._public_key.public_bytes(
+    @staticmethod
+    def _derive_device_id(public_key) -> Tuple[str, str]:
+        """Return (device ID, base64 public key) from one raw serialization."""
+        # Device ID must be derived from public key fingerprint (full SHA-256)
+        public_bytes = public_key.public_bytes(
             encoding=serialization.Encoding.Raw,
             format=serialization.PublicFormat.Raw
         )
-        return base64.b64encode(public_bytes).decode()
+        return hashlib.sha256(public_bytes).hexdigest(), base64.b64encode(public_bytes).decode()
 
-    def _build_auth_payload(self, nonce: str, signed_at: int, client_id: str,
-                              client_mode: str, role: str, scopes: list, token: str = "") -> str:
+    def _get_public_key_base64(self) -> str:
+        """Get public key as base64 string (cached when keys are loaded)."""
+        return self._public_key_b64
+
+    def _build_auth_payload(self, nonce: str, signed_at: int, token: str = "") -> str:
         """Build the pipe-delimited auth payload for signing."""
         # Format: version|deviceId|clientId|clientMode|role|scopes|signedAt|token|nonce
-        parts = [
-            "v2",  # version (v2 when nonce exists)
-            self._device_id,
-            client_id,
-            client_mode,
-            role,
-            ",".join(scopes),
-            str(signed_at),
-            token,
-            nonce,
-        ]
-        return "|".join(parts)
-
-    def _sign_challenge(self, payload: str) -> str:
-        """Sign the auth payload with device private key."""
+        return f"{self._auth_prefix}{signed_at}|{token}|{nonce}"
+
+    async def _sign_challenge(self, payload: str) -> str:
+        """Sign the auth payload with device private key (in the default executor)."""
         if not self._private_key:
             return ""
         message = payload.encode()
-        signature = self._private_key.sign(message)
+        loop = asyncio.get_running_loop()
+        signature = await loop.run_in_executor(None, self._private_key.sign, message)
         return base64.b64encode(signature).decode()
 
     @property
     def state(self) -> ConnectionState:
         """Get current connection state."""
-        with self._lock:
-            return self._state
+        return self._state
 
     @property
     def is_connected(self) -> bool:
@@ -289,14 +398,12 @@ class OpenClawWebSocketClient:
     @property
     def current_streaming_message(self) -> Optional[StreamingMessage]:
         """Get the current streaming message if any."""
-        with self._lock:
-            return self._current_streaming
+        return self._current_streaming
 
     @property
-    def status(self) -> Dict[str, Any]:
-        """Get current status data."""
-        with self._lock:
-            return dict(self._status)
+    def status(self) -> Mapping[str, Any]:
+        """Get current status data (a read-only published snapshot)."""
+        return self._status
 
     @property
     def messages(self) -> List[Dict]:
@@ -306,17 +413,59 @@ class OpenClawWebSocketClient:
 
     def _set_state(self, state: ConnectionState):
         """Update connection state and notify callback."""
-        with self._lock:
-            self._state = state
+        self._state = state
         if self._on_connection_change:
+            self._flush_pending_callbacks()
             try:
                 self._on_connection_change(state)
             except Exception as e:
-                print(f"[WebSocket] Connection callback error: {e}")
+                self._log.error("Connection callback error: %s", e)
+
+    def _update_status(self, **fields):
+        """Publish a new status snapshot with the given fields changed.
+
+        Only the event loop thread writes status; readers take the current
+        snapshot without locking, so it is replaced rather than mutated.
+        """
+        self._status = MappingProxyType({**self._status, **fields})
+
+    def _mark_status_dirty(self):
+        """Schedule one on_status_change call for a burst of status changes."""
+        if self._on_status_change and self._status_flush_handle is None:
+            # Chunks buffered before this change must be delivered before it
+            self._flush_chunks()
+            self._status_flush_handle = self._loop.call_later(
+                self.STATUS_FLUSH_INTERVAL, self._flush_status
+            )
+
+    def _flush_status(self):
+        """Deliver the latest status snapshot to on_status_change."""
+        if self._status_flush_handle is not None:
+            self._status_flush_handle.cancel()
+            self._status_flush_handle = None
+        try:
+            self._on_status_change(self.status)
+        except Exception as e:
+            self._log.error("Status callback error: %s", e)
+
+    def _flush_pending_callbacks(self):
+        """Deliver debounced status/chunk callbacks ahead of an immediate one.
+
+        Marking status dirty flushes buffered chunks first, so a pending
+        status always predates any pending chunks and is delivered first.
+        """
+        if self._status_flush_handle is not None:
+            self._flush_status()
+        self._flush_chunks()
 
     def _emit_notification(self, type_: str, title: str, message: str = "", duration: float = 2.0):
-        """Emit a notification event."""
+        """Emit a notification event (event loop thread only).
+
+        Thread-safe entry points schedule this with call_soon_threadsafe so
+        the pending-callback flush and on_notification run on the loop.
+        """
         if self._on_notification:
+            self._flush_pending_callbacks()
             try:
                 notification = Notification(
                     type=type_,
@@ -326,7 +475,7 @@ class OpenClawWebSocketClient:
                 )
                 self._on_notification(notification)
             except Exception as e:
-                print(f"[WebSocket] Notification callback error: {e}")
+                self._log.error("Notification callback error: %s", e)
 
     def start(self):
         """Start the WebSocket client in a background thread."""
@@ -353,7 +502,12 @@ class OpenClawWebSocketClient:
 
     def _run_loop(self):
         """Run the asyncio event loop in the background thread."""
-        self._loop = asyncio.new_event_loop()
+        # uvloop is optional; it only affects this client's private loop
+        try:
+            import uvloop
+            self._loop = uvloop.new_event_loop()
+        except ImportError:
+            self._loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self._loop)
 
         try:
@@ -388,27 +542,37 @@ class OpenClawWebSocketClient:
                     ping_interval=30,
                     ping_timeout=10,
                     close_timeout=5,
+                    max_size=2 ** 22,  # hello-ok/history snapshots can exceed 1 MiB
                 ) as ws:
                     self._websocket = ws
 
-                    # Send connect request (MUST be first frame)
-                    connected = await self._send_connect(ws)
-                    if not connected:
-                        print("[WebSocket] Connect handshake failed")
-                        continue
+                    # All outbound frames go through one queue and writer task
+                    self._send_queue = asyncio.Queue()
+                    writer = asyncio.ensure_future(self._writer_loop(ws, self._send_queue))
 
-                    self._set_state(ConnectionState.CONNECTED)
-                    self._reconnect_delay = 1.0
-                    self._reconnect_attempts = 0
+                    try:
+                        # Send connect request (MUST be first frame)
+                        connected = await self._send_connect(ws)
+                        if not connected:
+                            print("[WebSocket] Connect handshake failed")
+                            continue
 
-                    print("[WebSocket] Connected successfully")
-                    self._emit_notification("success", "Connected", f"Connected to OpenClaw")
+                        self._set_state(ConnectionState.CONNECTED)
+                        self._reconnect_delay = 1.0
+                        self._reconnect_attempts = 0
 
-                    # Discover and subscribe to sessions
-                    await self._post_connect_setup(ws)
+                        print("[WebSocket] Connected successfully")
+                        self._emit_notification("success", "Connected", f"Connected to OpenClaw")
 
-                    # Message receive loop
-                    await self._receive_loop(ws)
+                        # Discover and subscribe to sessions
+                        await self._post_connect_setup(ws)
+
+                        # Message receive loop
+                        await self._receive_loop(ws)
+                    finally:
+                        writer.cancel()
+                        self._send_queue = None
+                        self._fail_pending_requests()
 
             except Exception as e:
                 error_msg = str(e)
@@ -433,17 +597,50 @@ class OpenClawWebSocketClient:
 
         self._set_state(ConnectionState.DISCONNECTED)
 
+    async def _writer_loop(self, ws, queue: asyncio.Queue):
+        """Send queued frames in order; drains everything pending per wake-up."""
+        try:
+            while True:
+                await ws.send(await queue.get())
+                while not queue.empty():
+                    await ws.send(queue.get_nowait())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._log.error("Send error: %s", e)
+            # Nothing drains the queue after this, so drop the connection;
+            # the receive loop then ends and _connect_loop reconnects
+            try:
+                await ws.close(code=1011, reason="send failed")
+            except Exception:
+                pass
+
+    def _fail_pending_requests(self):
+        """Fail requests still awaiting a response on a closed connection."""
+        pending, self._pending_requests = self._pending_requests, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("connection closed"))
+
+    def _enqueue_send(self, message: str) -> bool:
+        """Queue a serialized frame for the writer task (event loop thread only)."""
+        if self._send_queue is None:
+            return False
+        self._send_queue.put_nowait(message)
+        return True
+
     async def _send_connect(self, ws) -> bool:
         """Handle OpenClaw connect handshake with challenge-response."""
 
         # Wait for challenge event first
         try:
             challenge_response = await asyncio.wait_for(ws.recv(), timeout=10.0)
-            challenge_data = json.loads(challenge_response)
-            print(f"[WebSocket] Received: {json.dumps(challenge_data)[:200]}")
+            challenge_data = _json_loads(challenge_response)
+            if DEBUG:
+                print(f"[WebSocket] Received: {_json_dumps(challenge_data)[:200]}")
 
             if challenge_data.get("type") != "event" or challenge_data.get("event") != "connect.challenge":
-                print(f"[WebSocket] Expected connect.challenge, got: {challenge_data.get('event', challenge_data.get('type'))}")
+                print(f"[WebSocket] Expected connect.challenge, got: {_first_key(challenge_data, ('event', 'type'))}")
                 return False
 
             challenge_payload = challenge_data.get("payload", {})
@@ -456,23 +653,19 @@ class OpenClawWebSocketClient:
 
         # Build connect params with signed challenge
         signed_at = int(time.time() * 1000)
-        client_id = "cli"
-        client_mode = "cli"
-        role = "operator"
-        scopes = ["operator.read", "operator.write", "operator.admin"]
         token = self.password or ""
 
         connect_params = {
             "minProtocol": 3,
             "maxProtocol": 3,
             "client": {
-                "id": client_id,
+                "id": self.CLIENT_ID,
                 "version": "1.0.0",
                 "platform": "linux",
-                "mode": client_mode,
+                "mode": self.CLIENT_MODE,
             },
-            "role": role,
-            "scopes": scopes,
+            "role": self.ROLE,
+            "scopes": self.SCOPES,
         }
 
         # Add device with signature if crypto is available
@@ -481,14 +674,11 @@ class OpenClawWebSocketClient:
             auth_payload = self._build_auth_payload(
                 nonce=nonce,
                 signed_at=signed_at,
-                client_id=client_id,
-                client_mode=client_mode,
-                role=role,
-                scopes=scopes,
                 token=token,
             )
-            print(f"[WebSocket] Auth payload: {auth_payload}")
-            signature = self._sign_challenge(auth_payload)
+            if DEBUG:
+                print(f"[WebSocket] Auth payload: {auth_payload}")
+            signature = await self._sign_challenge(auth_payload)
             connect_params["device"] = {
                 "id": self._device_id,
                 "publicKey": self._get_public_key_base64(),
@@ -512,20 +702,22 @@ class OpenClawWebSocketClient:
 
         connect_msg = {
             "type": "req",
-            "id": self._next_request_id(),
+            "id": str(self._next_request_id()),
             "method": "connect",
             "params": connect_params,
         }
 
-        await ws.send(json.dumps(connect_msg))
-        print(f"[WebSocket] Sent connect request: {json.dumps(connect_params, indent=2)}")
+        self._enqueue_send(_json_dumps(connect_msg))
+        if DEBUG:
+            print(f"[WebSocket] Sent connect request: {json.dumps(connect_params, indent=2)}")
 
         # Wait for connect response
         try:
             while True:
                 response = await asyncio.wait_for(ws.recv(), timeout=10.0)
-                data = json.loads(response)
-                print(f"[WebSocket] Received: {json.dumps(data)[:200]}")
+                data = _json_loads(response)
+                if DEBUG:
+                    print(f"[WebSocket] Received: {_json_dumps(data)[:200]}")
 
                 msg_type = data.get("type")
 
@@ -533,7 +725,9 @@ class OpenClawWebSocketClient:
                     # This is the response to our connect request
                     if data.get("ok"):
                         payload = data.get("payload", {})
-                        print(f"[WebSocket] Authenticated. Full payload: {json.dumps(payload, default=str)[:1000]}")
+                        print("[WebSocket] Authenticated")
+                        if DEBUG:
+                            print(f"[WebSocket] Full payload: {_json_dumps(payload, default=str)[:1000]}")
                         # Store session info if provided
                         if "sessionId" in payload:
                             self._session_id = payload["sessionId"]
@@ -541,21 +735,17 @@ class OpenClawWebSocketClient:
                             print("[WebSocket] Received device token")
 
                         # Parse gateway snapshot from hello-ok
-                        with self._lock:
-                            self._gateway_info = {
-                                "uptimeMs": payload.get("uptimeMs", 0),
-                                "stateVersion": payload.get("stateVersion", 0),
-                                "ts": payload.get("ts", 0),
-                            }
-                            presence = payload.get("presence", [])
-                            if isinstance(presence, list):
-                                self._presence_data = {
-                                    d.get("deviceId", d.get("id", str(i))): d
-                                    for i, d in enumerate(presence)
-                                }
-                            health = payload.get("health", {})
-                            if isinstance(health, dict):
-                                self._health_data = health
+                        self._gateway_info = MappingProxyType({
+                            "uptimeMs": payload.get("uptimeMs", 0),
+                            "stateVersion": payload.get("stateVersion", 0),
+                            "ts": payload.get("ts", 0),
+                        })
+                        presence = payload.get("presence", [])
+                        if isinstance(presence, list):
+                            self._presence_data = MappingProxyType(self._index_presence(presence))
+                        health = payload.get("health", {})
+                        if isinstance(health, dict):
+                            self._health_data = MappingProxyType(health)
 
                         return True
                     else:
@@ -602,20 +792,14 @@ class OpenClawWebSocketClient:
         """Discover sessions after connecting."""
         print("[WebSocket] Discovering sessions...")
 
-        req_id = self._next_request_id()
-        request = {
-            "type": "req",
-            "id": req_id,
-            "method": "sessions.list",
-            "params": {},
-        }
-        await ws.send(json.dumps(request))
+        req_id = str(self._next_request_id())
+        self._enqueue_send(_SESSIONS_LIST_FRAME % req_id)
 
         try:
-            deadline = time.time() + 5.0
-            while time.time() < deadline:
+            deadline_ns = time.monotonic_ns() + 5_000_000_000
+            while time.monotonic_ns() < deadline_ns:
                 raw = await asyncio.wait_for(ws.recv(), timeout=5.0)
-                data = json.loads(raw)
+                data = _json_loads(raw)
 
                 if data.get("type") == "res" and data.get("id") == req_id:
                     if data.get("ok"):
@@ -649,8 +833,7 @@ class OpenClawWebSocketClient:
                             model = target.get("model", "unknown")
                             print(f"[WebSocket] Using session: key={self._session_key} model={model}")
 
-                            with self._lock:
-                                self._status["model"] = model
+                            self._update_status(model=model)
                         else:
                             print("[WebSocket] No sessions available")
                     else:
@@ -672,39 +855,34 @@ class OpenClawWebSocketClient:
 
     async def _load_chat_history(self, ws):
         """Load recent chat history for the active session."""
-        req_id = self._next_request_id()
-        request = {
-            "type": "req",
-            "id": req_id,
-            "method": "chat.history",
-            "params": {"sessionKey": self._session_key},
-        }
-        await ws.send(json.dumps(request))
+        req_id = str(self._next_request_id())
+        self._enqueue_send(
+            _CHAT_HISTORY_FRAME % (req_id, _json_dumps(self._session_key), self.HISTORY_LIMIT)
+        )
 
         try:
-            deadline = time.time() + 5.0
-            while time.time() < deadline:
+            deadline_ns = time.monotonic_ns() + 5_000_000_000
+            while time.monotonic_ns() < deadline_ns:
                 raw = await asyncio.wait_for(ws.recv(), timeout=5.0)
-                data = json.loads(raw)
+                data = _json_loads(raw)
 
                 if data.get("type") == "res" and data.get("id") == req_id:
                     if data.get("ok"):
                         payload = data.get("payload", {})
-                        messages = payload.get("messages", payload.get("history", []))
+                        messages = _first_key(payload, ("messages", "history"), [])
                         if isinstance(payload, list):
                             messages = payload
 
                         loaded = 0
-                        for msg in messages[-10:]:  # Last 10 messages
+                        for msg in messages[-self.HISTORY_LIMIT:]:
                             role = msg.get("role", "")
                             content = msg.get("content", "")
                             # Handle content block arrays
                             if isinstance(content, list):
-                                text_parts = []
-                                for block in content:
-                                    if isinstance(block, dict) and block.get("type") == "text":
-                                        text_parts.append(block.get("text", ""))
-                                content = "\n".join(text_parts)
+                                content = "\n".join(
+                                    block.get("text", "") for block in content
+                                    if isinstance(block, dict) and block.get("type") == "text"
+                                )
                             if role and content:
                                 with self._lock:
                                     self._messages.append({
@@ -727,287 +905,368 @@ class OpenClawWebSocketClient:
             print("[WebSocket] chat.history timed out")
 
     async def _receive_loop(self, ws):
-        """Receive and process messages."""
-        async for message in ws:
-            if not self._running:
-                break
+        """Receive messages and process them in batches."""
+        # A reader task feeds the inbox; each pass drains whatever has piled
+        # up so bursts of streamed deltas are handled together
+        inbox: asyncio.Queue = asyncio.Queue(maxsize=self.INBOX_MAX_FRAMES)
+        reader = asyncio.ensure_future(self._read_frames(ws, inbox))
 
-            try:
-                data = json.loads(message)
-                await self._handle_message(data)
-            except json.JSONDecodeError as e:
-                print(f"[WebSocket] Invalid JSON: {e}")
-            except Exception as e:
-                print(f"[WebSocket] Message handling error: {e}")
+        try:
+            while True:
+                batch = [await inbox.get()]
+                while not inbox.empty():
+                    batch.append(inbox.get_nowait())
 
-    async def _handle_message(self, data: Dict):
-        """Handle incoming message based on OpenClaw protocol."""
-        msg_type = data.get("type", "")
-
-        if msg_type == "res":
-            # Response to a request we sent
-            req_id = data.get("id")
-            ok = data.get("ok", False)
-            payload = data.get("payload", {})
-
-            # Log important responses
-            if ok and isinstance(payload, dict) and "runId" in payload:
-                print(f"[WebSocket] Run started: {payload.get('runId', '?')[:12]} status={payload.get('status', '?')}")
-            elif not ok:
-                error = data.get("error", {})
-                print(f"[WebSocket] Request {req_id} failed: {error.get('message', error)}")
-
-            if req_id in self._pending_requests:
-                future = self._pending_requests.pop(req_id)
-                if not future.done():
-                    future.set_result(data)
-
-        elif msg_type == "event":
-            # Server-initiated event
-            event_name = data.get("event", "")
-            payload = data.get("payload", {})
-            await self._handle_event(event_name, payload)
-
-        elif msg_type == "req":
-            # Server is requesting something from us (rare for display client)
-            method = data.get("method", "")
-            print(f"[WebSocket] Received request: {method}")
-
-    async def _handle_event(self, event_name: str, payload: Dict):
-        """Handle OpenClaw events."""
+                ended = batch[-1] is None
+                if ended:
+                    batch.pop()
 
-        if event_name == "agent":
-            # Agent events carry stream type and data
-            stream = payload.get("stream", "")
-            data = payload.get("data", {})
-            run_id = payload.get("runId", "unknown")
-
-            if stream == "lifecycle":
-                phase = data.get("phase", "")
-                if phase == "start":
-                    print(f"[WebSocket] Agent run started: {run_id[:12]}")
-                    with self._lock:
-                        self._status["is_streaming"] = True
-                        self._status["current_task"] = "Processing..."
-                    if self._on_status_change:
-                        try:
-                            self._on_status_change(self.status)
-                        except Exception as e:
-                            print(f"[WebSocket] Status callback error: {e}")
-
-                elif phase == "end":
-                    print(f"[WebSocket] Agent run ended: {run_id[:12]}")
-                    with self._lock:
-                        if self._current_streaming:
-                            self._current_streaming.complete = True
-                            self._current_streaming = None
-                        self._status["is_streaming"] = False
-                        self._status["current_task"] = "Idle"
-                    if self._on_status_change:
-                        try:
-                            self._on_status_change(self.status)
-                        except Exception as e:
-                            print(f"[WebSocket] Status callback error: {e}")
-
-                elif phase == "error":
-                    error_msg = data.get("error", data.get("message", "Agent error"))
-                    if isinstance(error_msg, dict):
-                        error_msg = error_msg.get("message", str(error_msg))
-                    print(f"[WebSocket] Agent run error: {run_id[:12]} - {error_msg}")
-                    with self._lock:
-                        self._current_streaming = None
-                        self._status["is_streaming"] = False
-                        self._status["current_task"] = "Error"
-                    self._emit_notification("error", "Agent Error", str(error_msg)[:80], duration=5.0)
-                    if self._on_status_change:
-                        try:
-                            self._on_status_change(self.status)
-                        except Exception as e:
-                            print(f"[WebSocket] Status callback error: {e}")
-
-            elif stream == "assistant":
-                # Streaming text delta from assistant
-                delta = data.get("delta", "")
-                if delta:
-                    with self._lock:
-                        if self._current_streaming is None:
-                            self._current_streaming = StreamingMessage(
-                                id=run_id,
-                                role="assistant",
-                            )
-                            self._status["is_streaming"] = True
-                        self._current_streaming.append_chunk(delta)
-
-                    if self._on_message_chunk:
-                        try:
-                            self._on_message_chunk(run_id, delta)
-                        except Exception as e:
-                            print(f"[WebSocket] Chunk callback error: {e}")
-
-            elif stream == "tool":
-                # Tool use events
-                tool_name = data.get("tool", data.get("name", "tool"))
-                tool_status = data.get("status", "")
-                if tool_status == "start" or "start" in str(data.get("phase", "")):
-                    self._emit_notification("info", f"Tool: {tool_name}", "Running...", duration=10.0)
-                    with self._lock:
-                        self._status["current_task"] = f"Running: {tool_name}"
-                elif tool_status in ("end", "done", "complete"):
-                    self._emit_notification("success", f"Tool: {tool_name}", "Done", duration=1.0)
-
-            # Other agent streams (thinking, etc.) - silently ignore
-
-        elif event_name == "chat":
-            # Chat events carry message state
-            state = payload.get("state", "")
-            message = payload.get("message", {})
-            run_id = payload.get("runId", "unknown")
-
-            if state == "final":
-                # Message complete
-                role = message.get("role", "assistant")
-                content_blocks = message.get("content", [])
-                # Extract text from all content blocks
-                text_parts = []
-                for block in content_blocks:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        text_parts.append(block.get("text", ""))
-                    elif isinstance(block, str):
-                        text_parts.append(block)
-                text = "\n".join(text_parts)
-
-                completed = {
-                    "role": role,
-                    "content": text,
-                    "timestamp": datetime.now(),
-                }
-
-                with self._lock:
-                    self._current_streaming = None
-                    self._status["is_streaming"] = False
-                    self._messages.append(completed)
-                    if len(self._messages) > self._max_messages:
-                        self._messages = self._messages[-self._max_messages:]
-
-                print(f"[WebSocket] Message complete ({len(text)} chars)")
-
-                if self._on_message_complete:
+                for raw in batch:
                     try:
-                        self._on_message_complete(completed)
+                        data = _json_loads(raw)
+                    except json.JSONDecodeError as e:
+                        self._log.warning("Invalid JSON: %s", e)
+                        continue
+                    try:
+                        await self._handle_message(data)
                     except Exception as e:
-                        print(f"[WebSocket] Complete callback error: {e}")
+                        self._log.error("Message handling error: %s", e)
 
-            # state == "delta" is redundant with agent assistant stream, skip it
+                if ended or not self._running:
+                    break
+        finally:
+            if not reader.done():
+                reader.cancel()
 
-        elif event_name == "tick":
-            self._last_tick = time.time()
+        # Surface connection errors so _connect_loop schedules a reconnect
+        if reader.done() and not reader.cancelled():
+            reader.result()
 
-        elif event_name == "health":
-            with self._lock:
-                self._health_data = payload
+    async def _read_frames(self, ws, inbox: asyncio.Queue):
+        """Push raw frames into the inbox; None marks the end of the stream."""
+        from websockets.exceptions import ConnectionClosedOK
 
-        elif event_name in ("error",):
-            error = payload.get("message", payload.get("error", "Unknown error"))
-            self._emit_notification("error", "Error", str(error)[:50], duration=5.0)
+        # websockets >= 14 can return text frames as raw bytes, skipping the
+        # UTF-8 decode pass since the JSON parser validates the payload anyway
+        recv_kwargs = {}
+        if "decode" in inspect.signature(ws.recv).parameters:
+            recv_kwargs["decode"] = False
 
-        elif event_name in ("cancelled", "cancel"):
-            self._emit_notification("warning", "Cancelled", "", duration=2.0)
-            with self._lock:
-                self._current_streaming = None
-                self._status["is_streaming"] = False
-
-        elif event_name == "shutdown":
-            reason = payload.get("reason", "unknown")
-            restart_ms = payload.get("restartExpectedMs")
-            msg = f"Shutdown: {reason}"
-            if restart_ms:
-                msg += f" (restart in {restart_ms // 1000}s)"
-            print(f"[WebSocket] {msg}")
-            self._emit_notification("warning", "Gateway Shutdown", msg, duration=10.0)
-
-        elif event_name == "presence":
-            with self._lock:
-                devices = payload.get("devices", payload.get("clients", []))
-                if isinstance(devices, list):
-                    self._presence_data = {
-                        d.get("deviceId", d.get("id", str(i))): d
-                        for i, d in enumerate(devices)
-                    }
-                elif isinstance(payload, dict):
-                    self._presence_data = payload
-
-        elif event_name == "exec.approval.requested":
-            tool = payload.get("tool", payload.get("name", "unknown"))
-            approval = {
-                "id": payload.get("id", payload.get("approvalId", "")),
-                "tool": tool,
-                "args": payload.get("args", payload.get("input", {})),
-                "description": payload.get("description", ""),
-                "run_id": payload.get("runId", ""),
-                "requested_at": time.time(),
+        try:
+            while self._running:
+                await inbox.put(await ws.recv(**recv_kwargs))
+        except ConnectionClosedOK:
+            pass
+        except asyncio.CancelledError:
+            # Cancelled by _receive_loop, which no longer waits for the sentinel
+            raise
+        except Exception:
+            await inbox.put(None)
+            raise
+        await inbox.put(None)
+
+    async def _handle_message(self, data: Dict):
+        """Handle incoming message based on OpenClaw protocol."""
+        # Heartbeats are the most frequent frame; record and return early
+        if data.get("event") == "tick":
+            self._last_tick = time.monotonic()
+            return
+        handler = self._message_handlers.get(data.get("type", ""))
+        if handler:
+            handler(data)
+
+    def _handle_response(self, data: Dict):
+        """Response to a request we sent."""
+        req_id = data.get("id")
+        ok = data.get("ok", False)
+        payload = data.get("payload", {})
+
+        # Log important responses
+        if ok and isinstance(payload, dict) and "runId" in payload:
+            if self._log.isEnabledFor(logging.INFO):
+                self._log.info("Run started: %s status=%s", payload.get("runId", "?")[:12], payload.get("status", "?"))
+        elif not ok:
+            error = data.get("error", {})
+            self._log.warning("Request %s failed: %s", req_id, error.get("message", error))
+
+        if self._pending_requests and isinstance(req_id, str) and req_id.isdigit():
+            future = self._pending_requests.pop(int(req_id), None)
+            if future and not future.done():
+                future.set_result(data)
+
+    def _handle_event_message(self, data: Dict):
+        """Server-initiated event."""
+        self._handle_event(data.get("event", ""), data.get("payload", {}))
+
+    def _handle_server_request(self, data: Dict):
+        """Server is requesting something from us (rare for display client)."""
+        if self._log.isEnabledFor(logging.INFO):
+            self._log.info("Received request: %s", data.get("method", ""))
+
+    def _handle_event(self, event_name: str, payload: Dict):
+        """Handle OpenClaw events."""
+        handler = self._event_handlers.get(event_name)
+        if handler:
+            handler(payload)
+        else:
+            # Truly unknown event - log it
+            if self._log.isEnabledFor(logging.INFO):
+                self._log.info("Unknown event: %s", event_name)
+
+    def _handle_agent_event(self, payload: Dict):
+        """Agent events carry stream type and data."""
+        handler = self._agent_stream_handlers.get(payload.get("stream", ""))
+        if handler:
+            handler(payload.get("runId", "unknown"), payload.get("data", {}))
+        # Other agent streams (thinking, etc.) - silently ignore
+
+    def _handle_lifecycle_stream(self, run_id: str, data: Dict):
+        """Handle agent run start/end/error phases."""
+        handler = self._lifecycle_phase_handlers.get(data.get("phase", ""))
+        if handler:
+            handler(run_id, data)
+
+    def _handle_run_start(self, run_id: str, data: Dict):
+        if self._log.isEnabledFor(logging.INFO):
+            self._log.info("Agent run started: %s", run_id[:12])
+        self._update_status(is_streaming=True, current_task="Processing...")
+        self._mark_status_dirty()
+
+    def _handle_run_end(self, run_id: str, data: Dict):
+        # Deliver any buffered text before the run is closed out
+        self._flush_chunks()
+        if self._log.isEnabledFor(logging.INFO):
+            self._log.info("Agent run ended: %s", run_id[:12])
+        if self._current_streaming:
+            self._current_streaming.complete = True
+            self._current_streaming = None
+        self._update_status(is_streaming=False, current_task="Idle")
+        self._mark_status_dirty()
+
+    def _handle_run_error(self, run_id: str, data: Dict):
+        self._flush_chunks()
+        error_msg = _first_key(data, ("error", "message"), "Agent error")
+        if isinstance(error_msg, dict):
+            error_msg = error_msg.get("message", str(error_msg))
+        self._log.warning("Agent run error: %s - %s", run_id[:12], error_msg)
+        self._current_streaming = None
+        self._update_status(is_streaming=False, current_task="Error")
+        self._emit_notification("error", "Agent Error", str(error_msg)[:80], duration=5.0)
+        self._mark_status_dirty()
+
+    def _handle_assistant_stream(self, run_id: str, data: Dict):
+        """Streaming text delta from assistant."""
+        delta = data.get("delta", "")
+        if delta:
+            if self._chunk_run_id != run_id:
+                self._flush_chunks()
+                self._chunk_run_id = run_id
+            if self._current_streaming is None:
+                self._current_streaming = StreamingMessage(
+                    id=run_id,
+                    role="assistant",
+                )
+                self._update_status(is_streaming=True)
+
+            # Deltas are buffered and applied to the streaming message and
+            # the chunk callback once per flush window, not once per token
+            self._chunk_buffer.append(delta)
+            if self._chunk_flush_handle is None:
+                self._chunk_flush_handle = self._loop.call_later(
+                    self.CHUNK_FLUSH_INTERVAL, self._flush_chunks
+                )
+
+    def _flush_chunks(self):
+        """Apply buffered deltas as a single chunk and notify on_message_chunk."""
+        if self._chunk_flush_handle is not None:
+            self._chunk_flush_handle.cancel()
+            self._chunk_flush_handle = None
+        if not self._chunk_buffer:
+            return
+
+        chunk = "".join(self._chunk_buffer)
+        self._chunk_buffer.clear()
+        if self._current_streaming is not None:
+            self._current_streaming.append_chunk(chunk)
+        if self._on_message_chunk:
+            if self._status_flush_handle is not None:
+                self._flush_status()
+            try:
+                self._on_message_chunk(self._chunk_run_id, chunk)
+            except Exception as e:
+                self._log.error("Chunk callback error: %s", e)
+
+    def _handle_tool_stream(self, run_id: str, data: Dict):
+        """Tool use events."""
+        tool_name = _first_key(data, ("tool", "name"), "tool")
+        tool_status = data.get("status", "")
+        if tool_status == "start" or "start" in str(data.get("phase", "")):
+            self._emit_notification("info", f"Tool: {tool_name}", "Running...", duration=10.0)
+            self._update_status(current_task=f"Running: {tool_name}")
+        elif tool_status in ("end", "done", "complete"):
+            self._emit_notification("success", f"Tool: {tool_name}", "Done", duration=1.0)
+
+    def _handle_chat_event(self, payload: Dict):
+        """Chat events carry message state."""
+        state = payload.get("state", "")
+        message = payload.get("message", {})
+
+        if state == "final":
+            # Message complete
+            self._flush_chunks()
+            role = message.get("role", "assistant")
+            content_blocks = message.get("content", [])
+            # Extract text from all content blocks (plain strings pass through)
+            text = "\n".join(
+                block if isinstance(block, str) else block.get("text", "")
+                for block in content_blocks
+                if isinstance(block, str) or (isinstance(block, dict) and block.get("type") == "text")
+            )
+
+            completed = {
+                "role": role,
+                "content": text,
+                "timestamp": datetime.now(),
             }
+
+            self._current_streaming = None
+            self._update_status(is_streaming=False)
             with self._lock:
-                self._pending_approvals.append(approval)
-            if self._on_approval_requested:
+                self._messages.append(completed)
+
+            if self._log.isEnabledFor(logging.INFO):
+                self._log.info("Message complete (%d chars)", len(text))
+
+            if self._on_message_complete:
+                self._flush_pending_callbacks()
                 try:
-                    self._on_approval_requested(approval)
+                    self._on_message_complete(completed)
                 except Exception as e:
-                    print(f"[WebSocket] Approval callback error: {e}")
-            self._emit_notification("warning", f"Approval: {tool}", "Needs approval", duration=10.0)
-
-        else:
-            # Truly unknown event - log it
-            print(f"[WebSocket] Unknown event: {event_name}")
+                    self._log.error("Complete callback error: %s", e)
+
+        # state == "delta" is redundant with agent assistant stream, skip it
+
+    def _handle_health_event(self, payload: Dict):
+        self._health_data = MappingProxyType(payload)
+
+    def _handle_error_event(self, payload: Dict):
+        error = _first_key(payload, ("message", "error"), "Unknown error")
+        self._emit_notification("error", "Error", str(error)[:50], duration=5.0)
+
+    def _handle_cancelled_event(self, payload: Dict):
+        self._flush_chunks()
+        self._emit_notification("warning", "Cancelled", "", duration=2.0)
+        self._current_streaming = None
+        self._update_status(is_streaming=False)
+
+    def _handle_shutdown_event(self, payload: Dict):
+        reason = payload.get("reason", "unknown")
+        restart_ms = payload.get("restartExpectedMs")
+        msg = f"Shutdown: {reason}"
+        if restart_ms:
+            msg += f" (restart in {restart_ms // 1000}s)"
+        self._log.warning("%s", msg)
+        self._emit_notification("warning", "Gateway Shutdown", msg, duration=10.0)
+
+    def _handle_presence_event(self, payload: Dict):
+        devices = _first_key(payload, ("devices", "clients"), [])
+        if isinstance(devices, list):
+            self._presence_data = MappingProxyType(self._index_presence(devices))
+        elif isinstance(payload, dict):
+            self._presence_data = MappingProxyType(payload)
+
+    @staticmethod
+    def _index_presence(devices: List[Dict]) -> Dict[str, Dict]:
+        """Index presence entries by device ID."""
+        try:
+            return {d["deviceId"]: d for d in devices}
+        except KeyError:
+            # Some entries lack deviceId; fall back to id, then object identity
+            # (unique within this snapshot, and keys are never displayed)
+            presence = {}
+            for d in devices:
+                key = d.get("deviceId") or d.get("id")
+                if key is None:
+                    key = f"_{id(d)}"
+                presence[key] = d
+            return presence
+
+    def _handle_approval_requested_event(self, payload: Dict):
+        tool = _first_key(payload, ("tool", "name"), "unknown")
+        approval = {
+            "id": _first_key(payload, ("id", "approvalId"), ""),
+            "tool": tool,
+            "args": _first_key(payload, ("args", "input"), {}),
+            "description": payload.get("description", ""),
+            "run_id": payload.get("runId", ""),
+            "requested_at": time.time(),
+        }
+        # Approvals without an ID get a per-object key so they don't
+        # overwrite each other
+        key = approval["id"] or f"_{id(approval)}"
+        with self._lock:
+            self._pending_approvals[key] = approval
+        if self._on_approval_requested:
+            self._flush_pending_callbacks()
+            try:
+                self._on_approval_requested(approval)
+            except Exception as e:
+                self._log.error("Approval callback error: %s", e)
+        self._emit_notification("warning", f"Approval: {tool}", "Needs approval", duration=10.0)
 
     async def _send_request(self, method: str, params: Dict = None) -> Optional[Dict]:
         """Send a request and wait for response."""
-        if not self._websocket or not self.is_connected:
+        if self._send_queue is None or not self.is_connected:
             return None
 
         req_id = self._next_request_id()
         request = {
             "type": "req",
-            "id": req_id,
+            "id": str(req_id),
             "method": method,
         }
         if params:
             request["params"] = params
 
         # Create future for response
-        future = asyncio.Future()
+        future = self._loop.create_future()
         self._pending_requests[req_id] = future
 
-        try:
-            await self._websocket.send(json.dumps(request))
+        self._enqueue_send(_json_dumps(request))
 
+        try:
             # Wait for response with timeout
             response = await asyncio.wait_for(future, timeout=30.0)
             ok = response.get("ok", False)
             if ok:
                 payload = response.get("payload", {})
                 # Log chat.send responses to confirm agent started
-                if method == "chat.send":
-                    run_id = payload.get("runId", "?")
-                    status = payload.get("status", "?")
-                    print(f"[WebSocket] chat.send accepted: runId={run_id[:12]} status={status}")
-            else:
-                print(f"[WebSocket] Request {method} failed: {json.dumps(response.get('error', {}), default=str)[:200]}")
+                if method == "chat.send" and self._log.isEnabledFor(logging.INFO):
+                    self._log.info(
+                        "chat.send accepted: runId=%s status=%s",
+                        payload.get("runId", "?")[:12], payload.get("status", "?"),
+                    )
+            elif self._log.isEnabledFor(logging.WARNING):
+                self._log.warning(
+                    "Request %s failed: %s", method,
+                    _json_dumps(response.get("error", {}), default=str)[:200],
+                )
             return response
 
         except asyncio.TimeoutError:
             self._pending_requests.pop(req_id, None)
-            print(f"[WebSocket] Request timeout: {method}")
+            self._log.warning("Request timeout: %s", method)
             return None
         except Exception as e:
             self._pending_requests.pop(req_id, None)
-            print(f"[WebSocket] Request error: {e}")
+            self._log.error("Request error: %s", e)
             return None
 
     def _build_chat_send_params(self, content: str) -> Dict:
         """Build params for chat.send with required fields."""
         params = {
             "message": content,
-            "idempotencyKey": str(uuid.uuid4()),
+            "idempotencyKey": f"{self._idem_prefix}-{next(self._idem_counter)}",
         }
         if self._session_key:
             params["sessionKey"] = self._session_key
@@ -1015,33 +1274,28 @@ class OpenClawWebSocketClient:
 
     async def _send_fire_and_forget(self, method: str, params: Dict):
         """Send a request without blocking the event loop for the response."""
-        if not self._websocket or not self.is_connected:
+        if self._send_queue is None or not self.is_connected:
             return
 
         req_id = self._next_request_id()
         request = {
             "type": "req",
-            "id": req_id,
+            "id": str(req_id),
             "method": method,
         }
         if params:
             request["params"] = params
 
-        # Register pending request so _handle_message logs the response
-        future = asyncio.Future()
-        self._pending_requests[req_id] = future
-
-        try:
-            await self._websocket.send(json.dumps(request))
-        except Exception as e:
-            self._pending_requests.pop(req_id, None)
-            print(f"[WebSocket] Send error: {e}")
+        # No future: nobody awaits it, and _handle_response logs the
+        # reply whether or not it is pending.
+        self._enqueue_send(_json_dumps(request))
 
     def send_command(self, command: str) -> bool:
         """Send a command to OpenClaw (thread-safe)."""
         if self._loop and self.is_connected:
             params = self._build_chat_send_params(command)
-            print(f"[WebSocket] Sending chat.send: {command[:80]} (session={self._session_key})")
+            if self._log.isEnabledFor(logging.INFO):
+                self._log.info("Sending chat.send: %s (session=%s)", command[:80], self._session_key)
             asyncio.run_coroutine_threadsafe(
                 self._send_fire_and_forget("chat.send", params),
                 self._loop
@@ -1053,7 +1307,8 @@ class OpenClawWebSocketClient:
         """Send a user message to OpenClaw (thread-safe)."""
         if self._loop and self.is_connected:
             params = self._build_chat_send_params(message)
-            print(f"[WebSocket] Sending chat.send: {message[:80]} (session={self._session_key})")
+            if self._log.isEnabledFor(logging.INFO):
+                self._log.info("Sending chat.send: %s (session=%s)", message[:80], self._session_key)
             asyncio.run_coroutine_threadsafe(
                 self._send_fire_and_forget("chat.send", params),
                 self._loop
@@ -1071,41 +1326,38 @@ class OpenClawWebSocketClient:
                 self._send_request("chat.abort", params),
                 self._loop
             )
-            self._emit_notification("warning", "Cancelling...", "", duration=1.0)
+            self._loop.call_soon_threadsafe(
+                self._emit_notification, "warning", "Cancelling...", "", 1.0
+            )
             return True
         return False
 
     # === Deep Integration Accessors ===
 
     @property
-    def presence_data(self) -> Dict[str, Any]:
-        with self._lock:
-            return dict(self._presence_data)
+    def presence_data(self) -> Mapping[str, Any]:
+        return self._presence_data
 
     @property
-    def health_data(self) -> Dict[str, Any]:
-        with self._lock:
-            return dict(self._health_data)
+    def health_data(self) -> Mapping[str, Any]:
+        return self._health_data
 
     @property
-    def gateway_info(self) -> Dict[str, Any]:
-        with self._lock:
-            return dict(self._gateway_info)
+    def gateway_info(self) -> Mapping[str, Any]:
+        return self._gateway_info
 
     @property
     def pending_approvals(self) -> List[Dict]:
         with self._lock:
-            return list(self._pending_approvals)
+            return list(self._pending_approvals.values())
 
     @property
-    def runs_data(self) -> List[Dict]:
-        with self._lock:
-            return list(self._runs_data)
+    def runs_data(self) -> Tuple[Dict, ...]:
+        return self._runs_data
 
     @property
-    def cron_data(self) -> List[Dict]:
-        with self._lock:
-            return list(self._cron_data)
+    def cron_data(self) -> Tuple[Dict, ...]:
+        return self._cron_data
 
     @property
     def last_tick(self) -> float:
@@ -1114,21 +1366,29 @@ class OpenClawWebSocketClient:
     def send_approval_response(self, approval_id: str, approved: bool):
         """Send approval response for a tool execution request (thread-safe)."""
         if self._loop and self.is_connected:
-            params = {
-                "id": approval_id,
-                "approved": approved,
-            }
             # Remove from pending list
             with self._lock:
-                self._pending_approvals = [
-                    a for a in self._pending_approvals if a.get("id") != approval_id
-                ]
-            asyncio.run_coroutine_threadsafe(
-                self._send_fire_and_forget("exec.approval.respond", params),
-                self._loop
+                if approval_id:
+                    self._pending_approvals.pop(approval_id, None)
+                else:
+                    for key in [k for k, a in self._pending_approvals.items() if not a["id"]]:
+                        del self._pending_approvals[key]
+            self._loop.call_soon_threadsafe(
+                self._send_approval_frame,
+                _json_dumps(approval_id),
+                "true" if approved else "false",
             )
             action = "Approved" if approved else "Denied"
-            self._emit_notification("info", f"Tool {action}", "", duration=2.0)
+            self._loop.call_soon_threadsafe(
+                self._emit_notification, "info", f"Tool {action}", "", 2.0
+            )
+
+    def _send_approval_frame(self, approval_id_json: str, approved_json: str):
+        """Queue a pre-serialized exec.approval.respond frame (event loop thread only)."""
+        if self.is_connected:
+            self._enqueue_send(
+                _APPROVAL_RESPOND_FRAME % (self._next_request_id(), approval_id_json, approved_json)
+            )
 
     def request_runs_list(self):
         """Request runs list from gateway (thread-safe)."""
@@ -1138,8 +1398,7 @@ class OpenClawWebSocketClient:
                 if resp and resp.get("ok"):
                     payload = resp.get("payload", {})
                     runs = payload.get("runs", payload if isinstance(payload, list) else [])
-                    with self._lock:
-                        self._runs_data = runs if isinstance(runs, list) else []
+                    self._runs_data = tuple(runs) if isinstance(runs, list) else ()
 
             asyncio.run_coroutine_threadsafe(_fetch_runs(), self._loop)
 
@@ -1151,8 +1410,7 @@ class OpenClawWebSocketClient:
                 if resp and resp.get("ok"):
                     payload = resp.get("payload", {})
                     jobs = payload.get("jobs", payload if isinstance(payload, list) else [])
-                    with self._lock:
-                        self._cron_data = jobs if isinstance(jobs, list) else []
+                    self._cron_data = tuple(jobs) if isinstance(jobs, list) else ()
 
             asyncio.run_coroutine_threadsafe(_fetch_cron(), self._loop)
 
@@ -1163,4 +1421,6 @@ class OpenClawWebSocketClient:
                 self._websocket.close(),
                 self._loop
             )
-            self._emit_notification("info", "Reconnecting...", "", duration=2.0)
+            self._loop.call_soon_threadsafe(
+                self._emit_notification, "info", "Reconnecting...", "", 2.0
+            )